@@ -1,10 +1,12 @@
 from numba import cuda
 import numba
+import numpy as np
 from .tensor_data import (
     to_index,
     index_to_position,
     TensorData,
     broadcast_index,
+    broadcast_position,
     shape_broadcast,
     MAX_DIMS,
 )
@@ -16,9 +18,46 @@ from .tensor_data import (
 to_index = cuda.jit(device=True)(to_index)
 index_to_position = cuda.jit(device=True)(index_to_position)
 broadcast_index = cuda.jit(device=True)(broadcast_index)
+# Kept private so `from .cuda_ops import *` does not replace the host
+# `minitorch.broadcast_position` with a device-only function.
+_broadcast_position = cuda.jit(device=True)(broadcast_position)
 
 THREADS_PER_BLOCK = 32
 
+# Largest grid y-dimension CUDA allows. Kernels launched with one block row
+# per outer index stride over rows beyond this.
+MAX_GRID_Y = 65535
+
+
+def _row_length(shape, size):
+    """
+    Number of consecutive ordinals each block row covers. Rows follow the
+    innermost axis when it fills at least one block of threads; narrower
+    tensors run as a single row of all ordinals so no thread sits idle.
+    """
+    inner = shape[len(shape) - 1]
+    if inner < THREADS_PER_BLOCK:
+        return size
+    return inner
+
+
+_device_row_length = cuda.jit(device=True)(_row_length)
+
+
+def _grid_2d(shape, size):
+    """
+    Launch configuration for element-wise kernels: `threadIdx.x` runs along
+    a row of consecutive ordinals (see :func:`_row_length`) so a warp
+    touches consecutive addresses, and `blockIdx.y` picks the row.
+    """
+    inner = _row_length(shape, size)
+    rows = size // inner
+    blockspergrid = (
+        (inner + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK,
+        min(rows, MAX_GRID_Y),
+    )
+    return blockspergrid, THREADS_PER_BLOCK
+
 
 def tensor_map(fn):
     """
@@ -42,8 +81,17 @@ def tensor_map(fn):
     """
 
     def _map(out, out_shape, out_strides, out_size, in_storage, in_shape, in_strides):
-        # TODO: Implement for Task 3.3.
-        raise NotImplementedError("Need to implement for Task 3.3")
+        out_index = cuda.local.array(MAX_DIMS, numba.int32)
+        inner = _device_row_length(out_shape, out_size)
+        x = cuda.blockIdx.x * cuda.blockDim.x + cuda.threadIdx.x
+        if x < inner:
+            for row in range(cuda.blockIdx.y, out_size // inner, cuda.gridDim.y):
+                to_index(row * inner + x, out_shape, out_index)
+                in_position = _broadcast_position(
+                    out_index, out_shape, in_shape, in_strides
+                )
+                out_position = index_to_position(out_index, out_strides)
+                out[out_position] = fn(in_storage[in_position])
 
     return cuda.jit()(_map)
 
@@ -57,8 +105,7 @@ def map(fn):
             out = a.zeros(a.shape)
 
         # Instantiate and run the cuda kernel.
-        threadsperblock = THREADS_PER_BLOCK
-        blockspergrid = (out.size + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+        blockspergrid, threadsperblock = _grid_2d(out.shape, out.size)
         f[blockspergrid, threadsperblock](*out.tuple(), out.size, *a.tuple())
         return out
 
@@ -101,8 +148,20 @@ def tensor_zip(fn):
         b_shape,
         b_strides,
     ):
-        # TODO: Implement for Task 3.3.
-        raise NotImplementedError("Need to implement for Task 3.3")
+        out_index = cuda.local.array(MAX_DIMS, numba.int32)
+        inner = _device_row_length(out_shape, out_size)
+        x = cuda.blockIdx.x * cuda.blockDim.x + cuda.threadIdx.x
+        if x < inner:
+            for row in range(cuda.blockIdx.y, out_size // inner, cuda.gridDim.y):
+                to_index(row * inner + x, out_shape, out_index)
+                a_position = _broadcast_position(
+                    out_index, out_shape, a_shape, a_strides
+                )
+                b_position = _broadcast_position(
+                    out_index, out_shape, b_shape, b_strides
+                )
+                out_position = index_to_position(out_index, out_strides)
+                out[out_position] = fn(a_storage[a_position], b_storage[b_position])
 
     return cuda.jit()(_zip)
 
@@ -112,9 +171,8 @@ def zip(fn):
 
     def ret(a, b):
         c_shape = shape_broadcast(a.shape, b.shape)
-        out = a.zeros(c_shape)
-        threadsperblock = THREADS_PER_BLOCK
-        blockspergrid = (out.size + (threadsperblock - 1)) // threadsperblock
+        out = a.zeros(c_shape, np.result_type(a.dtype, b.dtype))
+        blockspergrid, threadsperblock = _grid_2d(out.shape, out.size)
         f[blockspergrid, threadsperblock](
             *out.tuple(), out.size, *a.tuple(), *b.tuple()
         )
@@ -195,8 +253,33 @@ def tensor_reduce(fn):
         reduce_value,
     ):
         BLOCK_DIM = 1024
-        # TODO: Implement for Task 3.3.
-        raise NotImplementedError("Need to implement for Task 3.3")
+        cache = cuda.shared.array(BLOCK_DIM, numba.float64)
+        out_index = cuda.local.array(MAX_DIMS, numba.int32)
+        out_ordinal = cuda.blockIdx.x
+        pos = cuda.threadIdx.x
+
+        # One block per output cell: each thread loads one element of the
+        # block's BLOCK_DIM-wide slice of the reduced axis, then the block
+        # combines them pairwise in shared memory.
+        cache[pos] = reduce_value
+        if out_ordinal < out_size:
+            to_index(out_ordinal, out_shape, out_index)
+            out_position = index_to_position(out_index, out_strides)
+            k = out_index[reduce_dim] * BLOCK_DIM + pos
+            if k < a_shape[reduce_dim]:
+                out_index[reduce_dim] = k
+                cache[pos] = a_storage[index_to_position(out_index, a_strides)]
+            cuda.syncthreads()
+
+            step = 1
+            while step < BLOCK_DIM:
+                if pos % (2 * step) == 0:
+                    cache[pos] = fn(cache[pos], cache[pos + step])
+                cuda.syncthreads()
+                step *= 2
+
+            if pos == 0:
+                out[out_position] = cache[0]
 
     return cuda.jit()(_reduce)
 
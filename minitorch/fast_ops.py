@@ -1,12 +1,18 @@
+from functools import lru_cache
+
 import numpy as np
 from .tensor_data import (
     to_index,
+    increment_index,
     index_to_position,
     broadcast_index,
+    broadcast_position,
+    broadcast_strides,
+    collapse_dims,
     shape_broadcast,
     MAX_DIMS,
 )
-from numba import njit, prange
+from numba import njit, prange, get_num_threads
 
 
 # TIP: Use `NUMBA_DISABLE_JIT=1 pytest tests/ -m task3_1` to run these tests without JIT.
@@ -15,8 +21,115 @@ from numba import njit, prange
 # If you get an error, read the docs for NUMBA as to what is allowed
 # in these functions.
 to_index = njit(inline="always")(to_index)
+increment_index = njit(inline="always")(increment_index)
 index_to_position = njit(inline="always")(index_to_position)
 broadcast_index = njit(inline="always")(broadcast_index)
+broadcast_position = njit(inline="always")(broadcast_position)
+
+# Number of consecutive output ordinals each parallel task walks. Index
+# buffers are allocated once per block and stepped with `increment_index`.
+BLOCK_SIZE = 1024
+
+# Size of a cache line. Reduce divides it by the storage itemsize.
+CACHE_LINE_BYTES = 64
+
+# Highest rank that gets a generated map/zip kernel: one nested loop per
+# dimension, with shape and strides hoisted into locals.
+MAX_SPECIALIZED_RANK = 4
+
+_specialized = {}
+
+
+def _rank_kernel_source(rank, n_inputs, unit_inner=False):
+    """
+    Source for a map (`n_inputs=1`) or zip (`n_inputs=2`) kernel with one
+    nested loop per dimension. Each loop level adds its stride term to the
+    position computed by the level above, so no index buffer is needed.
+    Broadcasting is handled by giving inputs stride 0 on those dimensions
+    (see :func:`broadcast_strides`).
+
+    With `unit_inner`, every tensor is known to have stride 1 on the last
+    dimension. The innermost loop then runs over contiguous slices starting
+    at each row's base position, indexed directly by the loop variable, so
+    LLVM can vectorize it and broadcasting is only paid for in the outer
+    loops.
+    """
+    names = ["out"] + ["a", "b"][:n_inputs]
+    args = ["out", "out_strides"]
+    for x in names[1:]:
+        args += [f"{x}_storage", f"{x}_strides"]
+    lines = [f"def kernel({', '.join(args)}, shape):"]
+    for d in range(rank):
+        lines.append(f"    n{d} = shape[{d}]")
+        for x in names:
+            lines.append(f"    {x}_s{d} = {x}_strides[{d}]")
+    storage = {x: f"{x}_storage" for x in names[1:]}
+    storage["out"] = "out"
+    outer = rank - 1 if unit_inner else rank
+    indent = "    "
+    position = {x: "0" for x in names}
+    for d in range(rank):
+        loop = "prange" if d == 0 else "range"
+        if d == outer:
+            for x in names:
+                run = f"{storage[x]}[{position[x]} : {position[x]} + n{d}]"
+                lines.append(f"{indent}{x}_run = {run}")
+                storage[x] = f"{x}_run"
+                position[x] = f"i{d}"
+        lines.append(f"{indent}for i{d} in {loop}(n{d}):")
+        indent += "    "
+        if d < outer:
+            for x in names:
+                lines.append(f"{indent}{x}{d} = {position[x]} + i{d} * {x}_s{d}")
+                position[x] = f"{x}{d}"
+    values = ", ".join(f"{storage[x]}[{position[x]}]" for x in names[1:])
+    lines.append(f"{indent}{storage['out']}[{position['out']}] = fn({values})")
+    return "\n".join(lines) + "\n"
+
+
+def _rank_kernel(fn, rank, n_inputs, unit_inner=False):
+    "Compiled kernel for `fn` specialized on `rank`, built once and cached."
+    key = (fn, rank, n_inputs, unit_inner)
+    if key not in _specialized:
+        namespace = {"fn": fn, "prange": prange}
+        exec(_rank_kernel_source(rank, n_inputs, unit_inner), namespace)
+        _specialized[key] = njit(parallel=True)(namespace["kernel"])
+    return _specialized[key]
+
+
+@lru_cache(maxsize=1024)
+def _plan(fn, n_threads, out_shape, out_strides, *inputs):
+    """
+    Dispatch decision for one call signature of a map (one input) or zip
+    (two inputs) with `fn`. Training loops repeat the same shapes and
+    strides every step, so the broadcast, collapse and kernel lookup are
+    done once per signature.
+
+    Rank kernels only run their outermost loop in parallel. When the
+    collapsed shape has fewer outer entries than threads, the generic
+    kernel is used instead, since it splits any layout into blocks.
+
+    Args:
+        fn: jitted element-wise function
+        n_threads (int): number of threads numba runs parallel loops on
+        out_shape (tuple): shape of `out`
+        out_strides (tuple): strides of `out`
+        inputs (tuple): `(shape, strides)` of each input
+
+    Returns:
+        tuple : rank kernel (None to use the generic one), collapsed shape,
+        and collapsed strides of `out` followed by each input
+    """
+    strides = [out_strides] + [
+        broadcast_strides(out_shape, shape, in_strides) for shape, in_strides in inputs
+    ]
+    shape, strides = collapse_dims(out_shape, strides)
+    kernel = None
+    if len(shape) <= MAX_SPECIALIZED_RANK and shape[0] >= n_threads:
+        # Broadcasting only along outer dims leaves a contiguous inner run.
+        unit_inner = all(s[-1] == 1 for s in strides)
+        kernel = _rank_kernel(fn, len(shape), len(inputs), unit_inner)
+    return kernel, shape, strides
 
 
 def tensor_map(fn):
@@ -43,8 +156,24 @@ def tensor_map(fn):
     """
 
     def _map(out, out_shape, out_strides, in_storage, in_shape, in_strides):
-        # TODO: Implement for Task 3.1.
-        raise NotImplementedError("Need to implement for Task 3.1")
+        if np.array_equal(out_shape, in_shape) and np.array_equal(
+            out_strides, in_strides
+        ):
+            for i in prange(len(out)):
+                out[i] = fn(in_storage[i])
+        else:
+            size = len(out)
+            for block in prange((size + BLOCK_SIZE - 1) // BLOCK_SIZE):
+                start = block * BLOCK_SIZE
+                out_index = np.empty(MAX_DIMS, np.int32)
+                to_index(start, out_shape, out_index)
+                for i in range(start, min(start + BLOCK_SIZE, size)):
+                    in_position = broadcast_position(
+                        out_index, out_shape, in_shape, in_strides
+                    )
+                    out_position = index_to_position(out_index, out_strides)
+                    out[out_position] = fn(in_storage[in_position])
+                    increment_index(out_shape, out_index)
 
     return njit(parallel=True)(_map)
 
@@ -57,6 +186,11 @@ def map(fn):
       fn_map(a, out)
       out
 
+    `fn` is compiled with NumPy's error model: division by zero gives
+    inf or nan (e.g. `inv` at 0), as the simple backend does on its
+    NumPy storage, rather than raising ZeroDivisionError as `fn` does
+    on Python floats.
+
     Args:
         fn: function from float-to-float to apply.
         a (:class:`Tensor`): tensor to map over
@@ -67,13 +201,32 @@ def map(fn):
         :class:`Tensor` : new tensor
     """
 
-    # This line JIT compiles your tensor_map
-    f = tensor_map(njit()(fn))
+    # This line JIT compiles your tensor_map. NumPy's error model makes
+    # division by zero give inf/nan instead of raising, which drops the
+    # per-element check that keeps LLVM from vectorizing `/`.
+    jit_fn = njit(error_model="numpy")(fn)
+    f = tensor_map(jit_fn)
 
     def ret(a, out=None):
         if out is None:
             out = a.zeros(a.shape)
-        f(*out.tuple(), *a.tuple())
+        if out.shape == a.shape and out._tensor.strides == a._tensor.strides:
+            f(*out.tuple(), *a.tuple())
+            return out
+
+        kernel, shape, (out_strides, a_strides) = _plan(
+            jit_fn,
+            get_num_threads(),
+            out.shape,
+            out._tensor.strides,
+            (a.shape, a._tensor.strides),
+        )
+        out_storage = out._tensor._storage
+        a_storage = a._tensor._storage
+        if kernel is not None:
+            kernel(out_storage, out_strides, a_storage, a_strides, shape)
+        else:
+            f(out_storage, shape, out_strides, a_storage, shape, a_strides)
         return out
 
     return ret
@@ -117,8 +270,32 @@ def tensor_zip(fn):
         b_shape,
         b_strides,
     ):
-        # TODO: Implement for Task 3.1.
-        raise NotImplementedError("Need to implement for Task 3.1")
+        if (
+            np.array_equal(out_shape, a_shape)
+            and np.array_equal(out_shape, b_shape)
+            and np.array_equal(out_strides, a_strides)
+            and np.array_equal(out_strides, b_strides)
+        ):
+            for i in prange(len(out)):
+                out[i] = fn(a_storage[i], b_storage[i])
+        else:
+            size = len(out)
+            for block in prange((size + BLOCK_SIZE - 1) // BLOCK_SIZE):
+                start = block * BLOCK_SIZE
+                out_index = np.empty(MAX_DIMS, np.int32)
+                to_index(start, out_shape, out_index)
+                for i in range(start, min(start + BLOCK_SIZE, size)):
+                    a_position = broadcast_position(
+                        out_index, out_shape, a_shape, a_strides
+                    )
+                    b_position = broadcast_position(
+                        out_index, out_shape, b_shape, b_strides
+                    )
+                    out_position = index_to_position(out_index, out_strides)
+                    out[out_position] = fn(
+                        a_storage[a_position], b_storage[b_position]
+                    )
+                    increment_index(out_shape, out_index)
 
     return njit(parallel=True)(_zip)
 
@@ -130,6 +307,11 @@ def zip(fn):
       fn_zip = zip(fn)
       c = fn_zip(a, b)
 
+    `fn` is compiled with NumPy's error model: division by zero gives
+    inf or nan (e.g. `inv_back` at 0), as the simple backend does on its
+    NumPy storage, rather than raising ZeroDivisionError as `fn` does
+    on Python floats.
+
     Args:
         fn: function from two floats-to-float to apply
         a (:class:`Tensor`): tensor to zip over
@@ -138,12 +320,52 @@ def zip(fn):
     Returns:
         :class:`Tensor` : new tensor data
     """
-    f = tensor_zip(njit()(fn))
+    jit_fn = njit(error_model="numpy")(fn)
+    f = tensor_zip(jit_fn)
 
     def ret(a, b):
         c_shape = shape_broadcast(a.shape, b.shape)
-        out = a.zeros(c_shape)
-        f(*out.tuple(), *a.tuple(), *b.tuple())
+        out = a.zeros(c_shape, np.result_type(a.dtype, b.dtype))
+        if (
+            a.shape == b.shape == c_shape
+            and a._tensor.strides == b._tensor.strides == out._tensor.strides
+        ):
+            f(*out.tuple(), *a.tuple(), *b.tuple())
+            return out
+
+        kernel, shape, (out_strides, a_strides, b_strides) = _plan(
+            jit_fn,
+            get_num_threads(),
+            out.shape,
+            out._tensor.strides,
+            (a.shape, a._tensor.strides),
+            (b.shape, b._tensor.strides),
+        )
+        out_storage = out._tensor._storage
+        a_storage = a._tensor._storage
+        b_storage = b._tensor._storage
+        if kernel is not None:
+            kernel(
+                out_storage,
+                out_strides,
+                a_storage,
+                a_strides,
+                b_storage,
+                b_strides,
+                shape,
+            )
+        else:
+            f(
+                out_storage,
+                shape,
+                out_strides,
+                a_storage,
+                shape,
+                a_strides,
+                b_storage,
+                shape,
+                b_strides,
+            )
         return out
 
     return ret
@@ -159,6 +381,9 @@ def tensor_reduce(fn):
         * All indices use numpy buffers
         * Inner-loop should not call any functions or write non-local variables
 
+    `fn` must be associative and commutative (as add, mul and max are):
+    long reductions combine several interleaved partial results.
+
     Args:
         fn: reduction function mapping two floats to float.
         out (array): storage for `out` tensor.
@@ -175,8 +400,71 @@ def tensor_reduce(fn):
     """
 
     def _reduce(out, out_shape, out_strides, a_storage, a_shape, a_strides, reduce_dim):
-        # TODO: Implement for Task 3.1.
-        raise NotImplementedError("Need to implement for Task 3.1")
+        # Each output cell belongs to exactly one block, so no two threads
+        # write the same position.
+        size = len(out)
+        reduce_size = a_shape[reduce_dim]
+        n4 = reduce_size - reduce_size % 4
+        reduce_stride = a_strides[reduce_dim]
+        if reduce_stride < CACHE_LINE_BYTES // a_storage.itemsize:
+            # Reduced axis steps within a cache line: walk it innermost,
+            # keeping the running value in a register and writing each cell
+            # once. Neighbouring cells reuse the same lines.
+            for block in prange((size + BLOCK_SIZE - 1) // BLOCK_SIZE):
+                start = block * BLOCK_SIZE
+                out_index = np.empty(MAX_DIMS, np.int32)
+                to_index(start, out_shape, out_index)
+                for i in range(start, min(start + BLOCK_SIZE, size)):
+                    out_position = index_to_position(out_index, out_strides)
+                    a_position = index_to_position(out_index, a_strides)
+                    # Four independent accumulators break the serial
+                    # dependency on `acc`. Lanes 1-3 start from data rather
+                    # than `out`, so the start value is applied once.
+                    if n4 > 0:
+                        acc0 = fn(out[out_position], a_storage[a_position])
+                        acc1 = a_storage[a_position + reduce_stride]
+                        acc2 = a_storage[a_position + 2 * reduce_stride]
+                        acc3 = a_storage[a_position + 3 * reduce_stride]
+                        for k in range(4, n4, 4):
+                            p = a_position + k * reduce_stride
+                            acc0 = fn(acc0, a_storage[p])
+                            acc1 = fn(acc1, a_storage[p + reduce_stride])
+                            acc2 = fn(acc2, a_storage[p + 2 * reduce_stride])
+                            acc3 = fn(acc3, a_storage[p + 3 * reduce_stride])
+                        acc = fn(fn(acc0, acc1), fn(acc2, acc3))
+                    else:
+                        acc = out[out_position]
+                    for k in range(n4, reduce_size):
+                        acc = fn(acc, a_storage[a_position + k * reduce_stride])
+                    out[out_position] = acc
+                    increment_index(out_shape, out_index)
+        else:
+            # Reduced axis is an outer axis: sweep it outermost so the inner
+            # loop walks neighbouring output cells, which sit next to each
+            # other in `a` as well. The block of `out` stays in cache. When
+            # those runs are short, the block would instead touch many rows a
+            # power-of-two apart that alias to the same cache sets, which is
+            # why short strides take the branch above.
+            for block in prange((size + BLOCK_SIZE - 1) // BLOCK_SIZE):
+                start = block * BLOCK_SIZE
+                n = min(start + BLOCK_SIZE, size) - start
+                # Positions of the block's cells in `out` and `a` (at k = 0)
+                # do not depend on k: compute them once, so each step of
+                # the sweep only adds `k * reduce_stride`.
+                out_positions = np.empty(n, np.int64)
+                a_bases = np.empty(n, np.int64)
+                out_index = np.empty(MAX_DIMS, np.int32)
+                to_index(start, out_shape, out_index)
+                for j in range(n):
+                    out_positions[j] = index_to_position(out_index, out_strides)
+                    a_bases[j] = index_to_position(out_index, a_strides)
+                    increment_index(out_shape, out_index)
+                for k in range(reduce_size):
+                    a_offset = k * reduce_stride
+                    for j in range(n):
+                        out[out_positions[j]] = fn(
+                            out[out_positions[j]], a_storage[a_bases[j] + a_offset]
+                        )
 
     return njit(parallel=True)(_reduce)
 
@@ -198,7 +486,7 @@ def reduce(fn, start=0.0):
         :class:`Tensor` : new tensor
     """
 
-    f = tensor_reduce(njit()(fn))
+    f = tensor_reduce(njit(error_model="numpy")(fn))
 
     def ret(a, dim):
         out_shape = list(a.shape)
@@ -68,7 +68,7 @@ def sigmoid(x):
     Returns:
         float : sigmoid value
     """
-    return 1.0 / (1 + exp(-x)) if x >= 0 else exp(x) / (1 + exp(x))
+    return 1.0 / (1.0 + math.exp(-x)) if x >= 0 else math.exp(x) / (1.0 + math.exp(x))
 
 
 def relu(x):
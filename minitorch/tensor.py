@@ -5,6 +5,7 @@ Implementation of the core Tensor object for autodifferentiation.
 from .autodiff import Variable
 from .tensor_data import TensorData
 from . import operators
+import numpy as np
 
 
 # This class is very similar to Scalar so we implemented it for you.
@@ -52,6 +53,14 @@ class Tensor(Variable):
         """
         return self._tensor.size
 
+    @property
+    def dtype(self):
+        """
+        Returns:
+             dtype : element type of the tensor storage
+        """
+        return self._tensor.dtype
+
     @property
     def dims(self):
         """
@@ -63,7 +72,7 @@ class Tensor(Variable):
     def _ensure_tensor(self, b):
         "Turns a python number into a tensor with the same backend."
         if isinstance(b, (int, float)):
-            b = Tensor.make([b], (1,), backend=self.backend)
+            b = Tensor.make([b], (1,), backend=self.backend, dtype=self.dtype)
         else:
             b._type_(self.backend)
         return b
@@ -172,9 +181,9 @@ class Tensor(Variable):
         return Tensor(tensor_data, backend=self.backend)
 
     @staticmethod
-    def make(storage, shape, strides=None, backend=None):
+    def make(storage, shape, strides=None, backend=None, dtype=np.float64):
         "Create a new tensor from data"
-        return Tensor(TensorData(storage, shape, strides), backend=backend)
+        return Tensor(TensorData(storage, shape, strides, dtype), backend=backend)
 
     def expand(self, other):
         """
@@ -213,10 +222,17 @@ class Tensor(Variable):
         return Tensor.make(out._tensor._storage, self.shape, backend=self.backend)
         # END CODE CHANGE (2021)
 
-    def zeros(self, shape=None):
+    def zeros(self, shape=None, dtype=None):
+        if dtype is None:
+            dtype = self.dtype
+
         def zero(shape):
+            # np.zeros takes pre-zeroed pages from the allocator, so large
+            # outputs are not filled here and then again by the kernel.
             return Tensor.make(
-                [0] * int(operators.prod(shape)), shape, backend=self.backend
+                np.zeros(int(operators.prod(shape)), dtype=dtype),
+                shape,
+                backend=self.backend,
             )
 
         if shape is None:
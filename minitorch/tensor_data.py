@@ -1,6 +1,6 @@
 import random
 from .operators import prod
-from numpy import array, float64, ndarray
+from numpy import array, float64, int32, ndarray, zeros
 import numba
 
 MAX_DIMS = 32
@@ -36,6 +36,10 @@ def to_index(ordinal, shape, out_index):
     tensor produces every index exactly once. It
     may not be the inverse of `index_to_position`.
 
+    Indices are produced in row-major order (last dimension
+    fastest), so for a contiguous tensor consecutive ordinals
+    map to consecutive storage positions.
+
     Args:
         ordinal (int): ordinal position to convert.
         shape (tuple): tensor shape.
@@ -45,10 +49,33 @@ def to_index(ordinal, shape, out_index):
       None : Fills in `out_index`.
 
     """
-    for i in range(len(shape)):
-        cur_index = ordinal % shape[i]
-        out_index[i] = cur_index
-        ordinal = ordinal // shape[i]
+    # Copy, not alias: numba inlines this into prange loops, and updating
+    # `ordinal` in place there would overwrite the parallel loop index.
+    cur_ord = ordinal + 0
+    for i in range(len(shape) - 1, -1, -1):
+        out_index[i] = cur_ord % shape[i]
+        cur_ord = cur_ord // shape[i]
+
+
+def increment_index(shape, out_index):
+    """
+    Advance `out_index` in place to the index of the next ordinal
+    in `shape`, following the same order as :func:`to_index`.
+    Stepping this way avoids recomputing the whole index from an
+    ordinal when walking consecutive positions.
+
+    Args:
+        shape (tuple): tensor shape.
+        out_index (array): the index to advance.
+
+    Returns:
+      None : Updates `out_index`.
+    """
+    for i in range(len(shape) - 1, -1, -1):
+        out_index[i] += 1
+        if out_index[i] < shape[i]:
+            return
+        out_index[i] = 0
 
 
 def broadcast_index(big_index, big_shape, shape, out_index):
@@ -73,6 +100,94 @@ def broadcast_index(big_index, big_shape, shape, out_index):
         out_index[i] = 0 if shape[i] == 1 else big_index[big_dim]
 
 
+def broadcast_position(big_index, big_shape, shape, strides):
+    """
+    Convert a `big_index` into `big_shape` directly to a storage
+    position in a smaller tensor with `shape` and `strides`.
+    Equivalent to :func:`broadcast_index` followed by
+    :func:`index_to_position`, without filling an intermediate index.
+
+    Args:
+        big_index (array-like): multidimensional index of bigger tensor
+        big_shape (array-like): tensor shape of bigger tensor
+        shape (array-like): tensor shape of smaller tensor
+        strides (array-like): tensor strides of smaller tensor
+
+    Returns:
+        int : position in storage of the smaller tensor
+    """
+    offset = len(big_shape) - len(shape)
+    position = 0
+    for i in range(len(shape)):
+        if shape[i] != 1:
+            position += big_index[i + offset] * strides[i]
+    return position
+
+
+def broadcast_strides(big_shape, shape, strides):
+    """
+    Strides that index a smaller tensor with `shape` and `strides`
+    directly from an index into `big_shape`. Broadcast dimensions
+    (size 1 or missing) get stride 0, so
+    `index_to_position(big_index, broadcast_strides(...))` equals
+    :func:`broadcast_position`.
+
+    Args:
+        big_shape (array-like): tensor shape of bigger tensor
+        shape (array-like): tensor shape of smaller tensor
+        strides (array-like): tensor strides of smaller tensor
+
+    Returns:
+        array : strides with one entry per dimension of `big_shape`
+    """
+    out = zeros(len(big_shape), dtype=int32)
+    offset = len(big_shape) - len(shape)
+    for i in range(len(shape)):
+        if shape[i] != 1:
+            out[i + offset] = strides[i]
+    return out
+
+
+def collapse_dims(shape, strides_list):
+    """
+    Merge neighbouring dimensions of `shape` that every tensor walks as a
+    single run, and drop dimensions of size 1. Dimension `k` folds into
+    the run after it when, for each tensor,
+    `strides[k] == run_stride * run_size`.
+
+    Enumerating the collapsed shape in order visits the same storage
+    positions, in the same order, as enumerating `shape`.
+
+    Args:
+        shape (array-like): shape shared by all tensors
+        strides_list (list): strides of each tensor over `shape`
+
+    Returns:
+        tuple : collapsed shape and list of collapsed strides
+    """
+    new_shape = []
+    new_strides = [[] for _ in strides_list]
+    for k in range(len(shape) - 1, -1, -1):
+        if shape[k] == 1:
+            continue
+        if new_shape and all(
+            strides[k] == run[-1] * new_shape[-1]
+            for strides, run in zip(strides_list, new_strides)
+        ):
+            new_shape[-1] *= shape[k]
+        else:
+            new_shape.append(shape[k])
+            for strides, run in zip(strides_list, new_strides):
+                run.append(strides[k])
+    if not new_shape:
+        new_shape = [1]
+        new_strides = [[0] for _ in strides_list]
+    return (
+        array(new_shape[::-1], dtype=int32),
+        [array(run[::-1], dtype=int32) for run in new_strides],
+    )
+
+
 def shape_broadcast(shape1, shape2):
     """
     Broadcast two shapes to create a new union shape.
@@ -119,11 +234,13 @@ def strides_from_shape(shape):
 
 
 class TensorData:
-    def __init__(self, storage, shape, strides=None):
+    def __init__(self, storage, shape, strides=None, dtype=float64):
+        # `dtype` applies when building storage from a list; ndarray
+        # storage keeps its own element type.
         if isinstance(storage, ndarray):
             self._storage = storage
         else:
-            self._storage = array(storage, dtype=float64)
+            self._storage = array(storage, dtype=dtype)
 
         if strides is None:
             strides = strides_from_shape(shape)
@@ -132,12 +249,15 @@ class TensorData:
         assert isinstance(shape, tuple), "Shape must be tuple"
         if len(strides) != len(shape):
             raise IndexingError(f"Len of strides {strides} must match {shape}.")
-        self._strides = array(strides)
-        self._shape = array(shape)
+        # Kernels receive these arrays directly, so keep them as one
+        # contiguous int32 layout to match the index buffers they fill.
+        self._strides = array(strides, dtype=int32)
+        self._shape = array(shape, dtype=int32)
         self.strides = strides
         self.dims = len(strides)
         self.size = int(prod(shape))
         self.shape = shape
+        self.dtype = self._storage.dtype
         assert len(self._storage) == self.size
 
     def to_cuda_(self):  # pragma: no cover
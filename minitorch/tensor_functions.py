@@ -284,18 +284,21 @@ TensorFunctions = make_tensor_backend(TensorOps)
 
 
 # Helpers for Constructing tensors
-def zeros(shape, backend=TensorFunctions):
+def zeros(shape, backend=TensorFunctions, dtype=np.float64):
     """
     Produce a zero tensor of size `shape`.
 
     Args:
         shape (tuple): shape of tensor
         backend (:class:`Backend`): tensor backend
+        dtype (type): element type of the storage
 
     Returns:
         :class:`Tensor` : new tensor
     """
-    return Tensor.make([0] * int(operators.prod(shape)), shape, backend=backend)
+    return Tensor.make(
+        np.zeros(int(operators.prod(shape)), dtype=dtype), shape, backend=backend
+    )
 
 
 def rand(shape, backend=TensorFunctions, requires_grad=False):
@@ -316,7 +319,9 @@ def rand(shape, backend=TensorFunctions, requires_grad=False):
     return tensor
 
 
-def _tensor(ls, shape=None, backend=TensorFunctions, requires_grad=False):
+def _tensor(
+    ls, shape=None, backend=TensorFunctions, requires_grad=False, dtype=np.float64
+):
     """
     Produce a tensor with data ls and shape `shape`.
 
@@ -325,16 +330,17 @@ def _tensor(ls, shape=None, backend=TensorFunctions, requires_grad=False):
         shape (tuple): shape of tensor
         backend (:class:`Backend`): tensor backend
         requires_grad (bool): turn on autodifferentiation
+        dtype (type): element type of the storage
 
     Returns:
         :class:`Tensor` : new tensor
     """
-    tensor = Tensor.make(ls, shape, backend=backend)
+    tensor = Tensor.make(ls, shape, backend=backend, dtype=dtype)
     tensor.requires_grad_(requires_grad)
     return tensor
 
 
-def tensor(ls, backend=TensorFunctions, requires_grad=False):
+def tensor(ls, backend=TensorFunctions, requires_grad=False, dtype=np.float64):
     """
     Produce a tensor with data and shape from ls
 
@@ -342,6 +348,7 @@ def tensor(ls, backend=TensorFunctions, requires_grad=False):
         ls (list): data for tensor
         backend (:class:`Backend`): tensor backend
         requires_grad (bool): turn on autodifferentiation
+        dtype (type): element type of the storage
 
     Returns:
         :class:`Tensor` : new tensor
@@ -361,7 +368,9 @@ def tensor(ls, backend=TensorFunctions, requires_grad=False):
 
     cur = flatten(ls)
     shape = shape(ls)
-    return _tensor(cur, tuple(shape), backend=backend, requires_grad=requires_grad)
+    return _tensor(
+        cur, tuple(shape), backend=backend, requires_grad=requires_grad, dtype=dtype
+    )
 
 
 # Gradient check for tensors
@@ -1,11 +1,33 @@
 import numpy as np
+from . import operators
 from .tensor_data import (
     to_index,
     index_to_position,
-    broadcast_index,
+    broadcast_position,
     shape_broadcast,
 )
 
+# Operators with a NumPy ufunc of identical semantics. When every tensor
+# shares one layout, map and zip hand the whole storage to the ufunc
+# instead of looping in Python. `exp` is left out: `math.exp` raises
+# OverflowError where `np.exp` returns inf.
+FN_TO_UFUNC = {
+    operators.id: np.positive,
+    operators.neg: np.negative,
+    operators.add: np.add,
+    operators.mul: np.multiply,
+    operators.lt: np.less,
+    operators.eq: np.equal,
+}
+
+
+def _aligned(out, *tensors):
+    "True if every tensor has the same shape and strides as `out`."
+    return all(
+        t.shape == out.shape and t._tensor.strides == out._tensor.strides
+        for t in tensors
+    )
+
 
 def tensor_map(fn):
     """
@@ -39,11 +61,11 @@ def tensor_map(fn):
 
     def _map(out, out_shape, out_strides, in_storage, in_shape, in_strides):
         out_index = np.array(out_shape)
-        in_index = np.array(in_shape)
         for i in range(len(out)):
             to_index(i, out_shape, out_index)
-            broadcast_index(out_index, out_shape, in_shape, in_index)
-            in_storage_position = index_to_position(in_index, in_strides)
+            in_storage_position = broadcast_position(
+                out_index, out_shape, in_shape, in_strides
+            )
             out_storage_position = index_to_position(out_index, out_strides)
             out[out_storage_position] = fn(in_storage[in_storage_position])
 
@@ -81,11 +103,15 @@ def map(fn):
     """
 
     f = tensor_map(fn)
+    ufunc = FN_TO_UFUNC.get(fn)
 
     def ret(a, out=None):
         if out is None:
             out = a.zeros(a.shape)
-        f(*out.tuple(), *a.tuple())
+        if ufunc is not None and _aligned(out, a):
+            ufunc(a._tensor._storage, out=out._tensor._storage)
+        else:
+            f(*out.tuple(), *a.tuple())
         return out
 
     return ret
@@ -136,14 +162,14 @@ def tensor_zip(fn):
         b_strides,
     ):
         out_index = np.array(out_shape)
-        a_index = np.array(a_shape)
-        b_index = np.array(b_shape)
         for i in range(len(out)):
             to_index(i, out_shape, out_index)
-            broadcast_index(out_index, out_shape, a_shape, a_index)
-            broadcast_index(out_index, out_shape, b_shape, b_index)
-            a_storage_position = index_to_position(a_index, a_strides)
-            b_storage_position = index_to_position(b_index, b_strides)
+            a_storage_position = broadcast_position(
+                out_index, out_shape, a_shape, a_strides
+            )
+            b_storage_position = broadcast_position(
+                out_index, out_shape, b_shape, b_strides
+            )
             # Because of stride difference
             out_position = index_to_position(out_index, out_strides)
             out[out_position] = fn(
@@ -183,14 +209,18 @@ def zip(fn):
     """
 
     f = tensor_zip(fn)
+    ufunc = FN_TO_UFUNC.get(fn)
 
     def ret(a, b):
         if a.shape != b.shape:
             c_shape = shape_broadcast(a.shape, b.shape)
         else:
             c_shape = a.shape
-        out = a.zeros(c_shape)
-        f(*out.tuple(), *a.tuple(), *b.tuple())
+        out = a.zeros(c_shape, np.result_type(a.dtype, b.dtype))
+        if ufunc is not None and _aligned(out, a, b):
+            ufunc(a._tensor._storage, b._tensor._storage, out=out._tensor._storage)
+        else:
+            f(*out.tuple(), *a.tuple(), *b.tuple())
         return out
 
     return ret
@@ -219,17 +249,19 @@ def tensor_reduce(fn):
 
     def _reduce(out, out_shape, out_strides, a_storage, a_shape, a_strides, reduce_dim):
         out_index = np.array(out_shape)
-        a_index = np.array(a_shape)
+        length_of_reduced_dim = a_shape[reduce_dim]
+        reduce_stride = a_strides[reduce_dim]
 
         for i in range(len(out)):
             to_index(i, out_shape, out_index)
-            broadcast_index(out_index, out_shape, a_shape, a_index)
-            length_of_reduced_dim = a_shape[reduce_dim]
+            out_position = index_to_position(out_index, out_strides)
+            # Only the reduced coordinate changes along the walk, and it is 0
+            # in `out_index`, so the rest of the position is computed once.
+            a_base = index_to_position(out_index, a_strides)
+            acc = out[out_position]
             for k in range(length_of_reduced_dim):
-                a_index[reduce_dim] = k
-                out_position = index_to_position(out_index, out_strides)
-                a_position = index_to_position(a_index, a_strides)
-                out[out_position] = fn(out[out_position], a_storage[a_position])
+                acc = fn(acc, a_storage[a_base + k * reduce_stride])
+            out[out_position] = acc
 
     return _reduce
 
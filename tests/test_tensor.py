@@ -193,3 +193,12 @@ def test_reduce_forward_all_dims():
     t_summed_all_expected = tensor([27])
 
     assert_close(t_summed_all[0], t_summed_all_expected[0])
+
+
+@pytest.mark.task2_3
+def test_exp_overflow_layout():
+    "exp overflows the same way for aligned and permuted layouts."
+    t = tensor([[800.0, 0.0], [1.0, 2.0]])
+    for t1 in [t, t.permute(1, 0)]:
+        with pytest.raises(OverflowError):
+            t1.exp()
@@ -3,6 +3,7 @@ from hypothesis import given
 from hypothesis.strategies import data
 from .strategies import tensor_data, indices
 import pytest
+import numpy as np
 
 # ## Tasks 2.1
 
@@ -74,6 +75,27 @@ def test_index(tensor_data):
             tensor_data.index(tuple(base))
 
 
+@pytest.mark.task2_1
+@given(tensor_data())
+def test_to_index_row_major(tensor_data):
+    "Ordinals of a contiguous tensor enumerate its storage in order."
+    td = minitorch.TensorData([0] * tensor_data.size, tensor_data.shape)
+    for i, ind in enumerate(td.indices()):
+        assert td.index(ind) == i
+
+
+@pytest.mark.task2_1
+@given(tensor_data())
+def test_increment_index(tensor_data):
+    "Stepping with increment_index follows the to_index enumeration."
+    index = np.zeros(tensor_data.dims, np.int32)
+    expected = np.zeros(tensor_data.dims, np.int32)
+    for i in range(tensor_data.size):
+        minitorch.to_index(i, tensor_data.shape, expected)
+        assert np.array_equal(index, expected)
+        minitorch.increment_index(tensor_data.shape, index)
+
+
 @pytest.mark.task2_1
 @given(data())
 def test_permute(data):
@@ -117,6 +139,47 @@ def test_shape_broadcast():
     assert c == (2, 5)
 
 
+@pytest.mark.task2_2
+@given(data())
+def test_broadcast_position(data):
+    "Check fused broadcast position against broadcast_index + index_to_position."
+    td = data.draw(tensor_data())
+    big_shape = (2,) + tuple(s if s != 1 else 3 for s in td.shape)
+    big = minitorch.TensorData([0] * int(minitorch.prod(big_shape)), big_shape)
+    small_index = np.zeros(td.dims, np.int32)
+    for big_index in big.indices():
+        minitorch.broadcast_index(big_index, big_shape, td.shape, small_index)
+        position = minitorch.index_to_position(small_index, td.strides)
+        assert (
+            minitorch.broadcast_position(big_index, big_shape, td.shape, td.strides)
+            == position
+        )
+        strides = minitorch.broadcast_strides(big_shape, td.shape, td.strides)
+        assert minitorch.index_to_position(big_index, strides) == position
+
+
+@pytest.mark.task2_2
+@given(tensor_data())
+def test_collapse_dims(td):
+    "Collapsed dims visit the same positions in the same order."
+    out = minitorch.TensorData([0] * td.size, td.shape)
+
+    def positions(shape, strides):
+        index = np.zeros(len(shape), np.int32)
+        found = []
+        for i in range(int(minitorch.prod(shape))):
+            minitorch.to_index(i, shape, index)
+            found.append(minitorch.index_to_position(index, strides))
+        return found
+
+    shape, (out_strides, td_strides) = minitorch.collapse_dims(
+        td.shape, [out.strides, td.strides]
+    )
+    assert len(shape) <= td.dims
+    assert positions(shape, out_strides) == positions(td.shape, out.strides)
+    assert positions(shape, td_strides) == positions(td.shape, td.strides)
+
+
 @given(tensor_data())
 def test_string(tensor_data):
     tensor_data.to_string()
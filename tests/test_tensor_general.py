@@ -4,6 +4,7 @@ from minitorch import grad_check
 import pytest
 from hypothesis import given, settings
 import numba
+import numpy as np
 from hypothesis.strategies import integers, lists, data, permutations
 from .strategies import (
     tensors,
@@ -316,6 +317,96 @@ def test_permute(backend, data):
     minitorch.grad_check(permute, t1)
 
 
+@pytest.mark.task3_1
+def test_fast_multiple_blocks():
+    "Fast map, zip and reduce over layouts that span several blocks."
+    shape = (2, 3, 4, 5, 6, 7)
+    assert minitorch.prod(shape) > minitorch.fast_ops.BLOCK_SIZE
+    a = minitorch.rand(shape, backend=FastTensorBackend)
+    b = minitorch.rand((1, 3, 1, 5, 1, 7), backend=FastTensorBackend)
+    x = a.to_numpy()
+    y = b.to_numpy()
+
+    # Neither layout collapses below rank 6, so these take the generic kernels.
+    order = (5, 4, 3, 2, 1, 0)
+    assert np.allclose((-a.permute(*order)).to_numpy(), -x.transpose(order))
+    assert np.allclose((a * b).to_numpy(), x * y)
+    assert np.allclose(
+        (a.permute(*order) + b.permute(*order)).to_numpy(),
+        x.transpose(order) + y.transpose(order),
+    )
+    for dim in range(len(shape)):
+        assert np.allclose(
+            a.permute(*order).sum(dim).to_numpy(),
+            x.transpose(order).sum(dim, keepdims=True),
+        )
+
+
+@pytest.mark.task3_1
+@pytest.mark.parametrize(
+    "fn, start, np_fn",
+    [
+        (minitorch.operators.add, 0.0, np.sum),
+        (minitorch.operators.mul, 1.0, np.prod),
+        (minitorch.operators.max, -1e9, np.max),
+    ],
+)
+def test_fast_reduce_long_axes(fn, start, np_fn):
+    "Fast reduce over axes long enough to use interleaved accumulators."
+    reduce = minitorch.FastOps.reduce(fn, start)
+    for shape in [(3, 5, 9), (3, 9, 5)]:
+        a = minitorch.rand(shape, backend=FastTensorBackend) + 0.5
+        x = a.to_numpy()
+        for order in [(0, 1, 2), (2, 0, 1), (1, 2, 0)]:
+            t = a.permute(*order)
+            for dim in range(3):
+                assert np.allclose(
+                    reduce(t, dim).to_numpy(),
+                    np_fn(x.transpose(order), axis=dim, keepdims=True),
+                )
+
+
+@pytest.mark.parametrize("backend", backend_tests)
+def test_dtype(backend):
+    "Outputs keep the element type of their inputs and promote mixed ones."
+    t1 = minitorch.tensor(
+        [[1.0, -2.0, 3.0], [4.0, 5.0, -6.0]], backend=shared[backend], dtype=np.float32
+    )
+    t2 = t1.permute(1, 0)
+    for out in [t1 + t1, t1 * 2.0, -t1, t1.relu(), t2.exp(), t1.sum(1), t2.sum(1)]:
+        assert out.dtype == np.float32
+    assert_close_tensor(t1.sum(0), minitorch.tensor([[5.0, 3.0, -3.0]]))
+
+    # Mixed element types promote, whichever side the float32 tensor is on.
+    t3 = minitorch.tensor([[0.5], [0.25]], backend=shared[backend])
+    for out in [t1 + t3, t3 + t1, t1 * t3, t3 * t2.permute(1, 0)]:
+        assert out.dtype == np.float64
+    assert_close_tensor(
+        t3 + t1, minitorch.tensor([[1.5, -1.5, 3.5], [4.25, 5.25, -5.75]])
+    )
+
+
+@pytest.mark.task3_1
+def test_fast_divide_by_zero():
+    "Fast map and zip give inf at 0, as the simple backend's NumPy storage does."
+    backends = [
+        (FastTensorBackend, minitorch.FastOps),
+        (TensorBackend, minitorch.TensorOps),
+    ]
+    for backend, ops in backends:
+        x = minitorch.tensor([0.0, 2.0], backend=backend)
+        d = minitorch.tensor([1.0, 1.0], backend=backend)
+        with np.errstate(divide="ignore"):
+            inv = ops.map(minitorch.operators.inv)(x).to_numpy()
+            inv_back = ops.zip(minitorch.operators.inv_back)(x, d).to_numpy()
+        assert np.isposinf(inv[0]) and inv[1] == 0.5
+        assert np.isneginf(inv_back[0]) and inv_back[1] == -0.25
+
+    # Python floats, as used by the scalar backend, raise instead.
+    with pytest.raises(ZeroDivisionError):
+        minitorch.operators.inv(0.0)
+
+
 @pytest.mark.task3_2
 def test_mm2():
     a = minitorch.rand((2, 3), backend=FastTensorBackend)